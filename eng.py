@@ -2,16 +2,25 @@
 Restored original-style Tkinter UI + stable translation + safe TTS playback.
 
 Requirements:
-pip install ttkbootstrap gTTS pygame pyttsx3 deep-translator requests pydub
-and install ffmpeg if you want MP3->WAV conversion (recommended).
+pip install ttkbootstrap gTTS pygame pyttsx3 deep-translator requests
+and install ffmpeg if you want to save audio as WAV (optional).
 """
 
+import io
 import os
+import shutil
+import subprocess
+import hashlib
+import shelve
 import tempfile
 import threading
 import time
+from functools import lru_cache
+from concurrent.futures import Future
 import traceback
 import random
+import queue
+import re
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, filedialog
 
@@ -29,11 +38,8 @@ try:
 except Exception:
     gTTS = None
 
-# pydub optional for mp3->wav conversion
-try:
-    from pydub import AudioSegment
-except Exception:
-    AudioSegment = None
+# ffmpeg optional for mp3->wav conversion
+FFMPEG_PATH = shutil.which('ffmpeg')
 
 # pygame for playback
 try:
@@ -43,8 +49,73 @@ except Exception:
     pygame = None
     PYGAME_AVAILABLE = False
 
-import requests
-from deep_translator import GoogleTranslator
+# requests and deep_translator are imported on first use to keep window startup fast
+_http = None
+_http_lock = threading.Lock()
+
+
+def _get_http():
+    # One keep-alive session so repeated dictionary lookups reuse the TLS connection
+    global _http
+    with _http_lock:
+        if _http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            session.headers.update({'User-Agent': 'eng-app/1'})
+            session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=1))
+            _http = session
+        return _http
+
+
+class _DaemonPool:
+    """
+    Minimal bounded worker pool on daemon threads.
+    ThreadPoolExecutor joins its workers at interpreter exit, and the translator/gTTS
+    requests have no timeout, so a stuck request would keep the app alive after closing.
+    """
+    def __init__(self, max_workers, name):
+        self._jobs = queue.SimpleQueue()
+        for i in range(max_workers):
+            threading.Thread(target=self._worker, name=f'{name}-{i}', daemon=True).start()
+
+    def _worker(self):
+        while True:
+            future, fn, args = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(self, fn, *args):
+        future = Future()
+        self._jobs.put((future, fn, args))
+        return future
+
+    def map(self, fn, iterable):
+        # submit everything first so items run concurrently; results come back in order
+        futures = [self.submit(fn, item) for item in iterable]
+        return (f.result() for f in futures)
+
+    def shutdown(self):
+        # cancel queued jobs; running ones are abandoned along with their daemon threads
+        while True:
+            try:
+                future, _, _ = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            future.cancel()
+
+
+# Shared workers for click-triggered translation/TTS/lookup jobs; bounds concurrency so
+# rapid clicks queue up instead of piling parallel requests onto Google
+_pool = _DaemonPool(max_workers=2, name='eng-worker')
+# Fan-out workers for individual network requests (gTTS sentence chunks, note paragraph
+# and prefetch translations). Jobs on _pool submit here, so sharing _pool could deadlock;
+# work running on _io_pool must never submit to _io_pool itself for the same reason.
+_io_pool = _DaemonPool(max_workers=4, name='eng-io')
 
 
 # ----------------- Helper: ensure pygame mixer -----------------
@@ -54,34 +125,234 @@ def ensure_pygame():
         raise RuntimeError('pygame is required for audio playback. Install pygame in this environment.')
     try:
         if not pygame.mixer.get_init():
-            pygame.mixer.init()
+            # gTTS returns 24000 Hz mono MPEG-2 mp3; opening the device at the same rate
+            # means SDL_mixer plays it without resampling
+            pygame.mixer.init(frequency=24000, buffer=1024)
     except Exception as e:
         raise RuntimeError('Failed to initialize audio device: ' + str(e))
 
 
+# ----------------- Helper: mp3 -> wav via ffmpeg -----------------
+def _mp3_to_wav(mp3, wav):
+    if FFMPEG_PATH is None:
+        raise RuntimeError('ffmpeg not found on PATH.')
+    subprocess.run([FFMPEG_PATH, '-y', '-loglevel', 'error', '-i', mp3,
+                    '-ar', '22050', '-ac', '1', '-f', 'wav', wav], check=True)
+
+
+# ----------------- Helper: split long TTS text -----------------
+def _split_sentences(text, max_len=180):
+    """
+    Group sentences into chunks of at most `max_len` characters.
+    A single sentence longer than `max_len` becomes its own chunk.
+    """
+    chunks = []
+    current = ''
+    for sentence in re.split(r'(?<=[.!?])\s+', text.strip()):
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) > max_len:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = (current + ' ' + sentence) if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _gtts_bytes(text, lang):
+    buf = io.BytesIO()
+    gTTS(text=text, lang=lang).write_to_fp(buf)
+    return buf.getvalue()
+
+
+# ----------------- Helper: cached translation -----------------
+# GoogleTranslator.translate() stores the text on the instance before sending it, so an
+# instance must never be shared between threads; each thread keeps its own per pair
+_translators = threading.local()
+
+
+def _get_translator(source, target):
+    # GoogleTranslator validates languages in its constructor, so build one per pair
+    cache = getattr(_translators, 'by_pair', None)
+    if cache is None:
+        cache = _translators.by_pair = {}
+    key = (source, target)
+    translator = cache.get(key)
+    if translator is None:
+        from deep_translator import GoogleTranslator
+        translator = GoogleTranslator(source=source, target=target)
+        cache[key] = translator
+    return translator
+
+
+@lru_cache(maxsize=512)
+def _translate_cached(source, target, text):
+    return _get_translator(source, target).translate(text)
+
+
+def _translate_context(target, text):
+    # practice contexts are English, so English output needs no round-trip at all
+    if target == 'en':
+        return text
+    return _translate_cached('auto', target, text)
+
+
+def _translate_paragraphs(source, target, text):
+    # Translate paragraph by paragraph: keeps each request under the translator's length
+    # limit and lets unchanged paragraphs come straight from the cache. Paragraphs are sent
+    # concurrently on _io_pool, so this must not be called from an _io_pool worker.
+    parts = re.split(r'\n\s*\n', text)
+    return '\n\n'.join(_io_pool.map(lambda p: _translate_cached(source, target, p) if p.strip() else p,
+                                    parts))
+
+
+# ----------------- Helper: dictionary lookup -----------------
+@lru_cache(maxsize=256)
+def _lookup_word(word):
+    """
+    Fetch `word` from dictionaryapi.dev and return a short summary text.
+    Returns None when the API has no entry for the word; other HTTP errors raise,
+    so transient failures (429, 5xx) are not memoized and the next click retries.
+    """
+    url = f'https://api.dictionaryapi.dev/api/v2/entries/en/{word}'
+    resp = _get_http().get(url, timeout=8)
+    if resp.status_code == 404:
+        return None
+    resp.raise_for_status()
+    data = resp.json()
+    # the API response always has the same shape, so index directly and treat a
+    # missing key/element as "field absent" instead of chaining .get() calls
+    try:
+        entry = data[0]
+    except (KeyError, IndexError, TypeError):
+        return f'No definition found for "{word}".\n'
+    parts = [f"Word: {entry.get('word', word)}\n"]
+    try:
+        phonetic = entry['phonetics'][0].get('text')
+    except (KeyError, IndexError, TypeError):
+        phonetic = None
+    if phonetic:
+        parts.append(f'Pronunciation: {phonetic}\n')
+    try:
+        meaning = entry['meanings'][0]
+    except (KeyError, IndexError, TypeError):
+        parts.append('No meanings found.\n')
+    else:
+        try:
+            d0 = meaning['definitions'][0]
+            parts.append(f"Part of speech: {meaning.get('partOfSpeech', '')}\n")
+            parts.append(f"Definition: {d0.get('definition', '')}\n")
+            example = d0.get('example')
+            if example:
+                parts.append(f'Example: {example}\n')
+        except (KeyError, IndexError, TypeError):
+            pass
+    return ''.join(parts)
+
+
 # ----------------- TTS Player -----------------
 class TTSPlayer:
     """
-    - Uses gTTS (preferred) to generate MP3.
-    - Converts to WAV via pydub if available (recommended for pygame).
+    - Uses gTTS (preferred) to generate MP3, played directly by pygame.
+    - Converts to WAV via ffmpeg only when audio is saved as WAV (export).
     - Uses unique temp filenames to avoid permission issues on Windows.
+    - Keeps generated audio in an on-disk cache keyed by (lang, text).
     """
+    CACHE_MAX_BYTES = 100 * 1024 * 1024
+
     def __init__(self):
-        self.audio_file = None     # final playable file (wav preferred)
-        self._raw_mp3 = None       # raw mp3 path (if created)
+        # (cached path, in-memory mp3 or None) per generation, newest last; entries are
+        # only released once playback has moved past them, so a buffer SDL_mixer is still
+        # streaming and a file it still has open are never dropped or evicted mid-play
+        self._active_files = []
         self.is_playing = False
         self.paused = False
         self.lock = threading.Lock()
+        self.cache_dir = os.path.join(tempfile.gettempdir(), 'eng_tts_cache')
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @property
+    def audio_file(self):
+        return self._active_files[-1][0] if self._active_files else None
+
+    def _cache_key(self, text, lang):
+        return hashlib.sha256((lang + '\0' + text).encode('utf-8')).hexdigest()
+
+    def _cache_lookup(self, key):
+        for ext in ('.wav', '.mp3'):
+            path = os.path.join(self.cache_dir, key + ext)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _cache_store(self, tmp_path, key, ext):
+        # os.replace is atomic, so a half-written file never appears under its cache name
+        cache_path = os.path.join(self.cache_dir, key + ext)
+        os.replace(tmp_path, cache_path)
+        self.curate_cache()
+        return cache_path
+
+    def curate_cache(self):
+        """Evict least recently used cache entries once the cache exceeds CACHE_MAX_BYTES."""
+        try:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_atime, st.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.CACHE_MAX_BYTES:
+                    break
+                if any(path == p for p, _ in self._active_files):
+                    continue
+                try:
+                    os.remove(path)
+                    total -= size
+                except Exception:
+                    pass
+        except Exception as e:
+            print('Cache curation failed:', e)
 
     def generate(self, text, lang='en'):
         """
         Generate audio for `text` in language `lang`.
-        Returns path to final audio file.
+        MP3 is played directly by pygame; WAV is only produced by export().
+        Returns path to final audio file (served from the cache when possible).
         """
-        # cleanup previous files safely
-        self._stop_and_cleanup_playback()
-        self.cleanup()
+        # earlier files stay untouched: they may still be playing until play() switches over
+        key = self._cache_key(text, lang)
+        path = self._cache_lookup(key)
+        data = None
+        if path:
+            try:
+                os.utime(path)   # bump atime/mtime for LRU eviction
+            except Exception:
+                pass
+        else:
+            path, data = self._synthesize(text, lang, key)
+        # play fresh mp3 bytes from memory instead of reading back the file just written
+        with self.lock:
+            self._active_files.append((path, io.BytesIO(data) if data else None))
+        return path
+
+    def prefetch(self, text, lang='en'):
+        """
+        Populate the cache for `text` in language `lang` without touching playback.
+        Returns the cached path.
+        """
+        key = self._cache_key(text, lang)
+        return self._cache_lookup(key) or self._synthesize(text, lang, key)[0]
 
+    def _synthesize(self, text, lang, key):
+        # Generate audio for a cache miss and store it under `key`.
+        # Returns (cached path, mp3 bytes or None).
         # Try offline pyttsx3 for en only (optional)
         if lang.startswith('en') and pyttsx3 is not None and gTTS is None:
             try:
@@ -90,52 +361,48 @@ class TTSPlayer:
                 engine = pyttsx3.init()
                 engine.save_to_file(text, path)
                 engine.runAndWait()
-                self.audio_file = path
-                return path
+                return self._cache_store(path, key, '.wav'), None
             except Exception as e:
                 print('pyttsx3 fail, falling back to gTTS:', e)
 
         if gTTS is None:
             raise RuntimeError('gTTS not available. Install gTTS (pip install gTTS).')
 
-        # create unique mp3 file
+        # synthesize into memory; the only disk I/O is the single cache write
         try:
-            fd_mp3, mp3_path = tempfile.mkstemp(prefix='tts_', suffix='.mp3')
-            os.close(fd_mp3)
-            tts = gTTS(text=text, lang=lang)
-            tts.save(mp3_path)
-            self._raw_mp3 = mp3_path
+            chunks = _split_sentences(text)
+            if len(chunks) > 1:
+                # long text: fetch sentence chunks concurrently; mp3 frames concatenate safely
+                data = b''.join(_io_pool.map(lambda c: _gtts_bytes(c, lang), chunks))
+            else:
+                data = _gtts_bytes(text, lang)
         except Exception as e:
+            raise RuntimeError('gTTS generation failed: ' + str(e))
+
+        try:
+            fd_mp3, mp3_path = tempfile.mkstemp(prefix='tts_', suffix='.mp3')
+            with os.fdopen(fd_mp3, 'wb') as f:
+                f.write(data)
+            # pygame plays mp3 natively, so keep it as-is
+            return self._cache_store(mp3_path, key, '.mp3'), data
+        except Exception:
             # cleanup if created
             try:
                 if 'mp3_path' in locals() and os.path.exists(mp3_path):
                     os.remove(mp3_path)
             except Exception:
                 pass
-            raise RuntimeError('gTTS generation failed: ' + str(e))
-
-        # Convert to WAV if pydub available (recommended)
-        if AudioSegment is not None:
-            try:
-                fd_wav, wav_path = tempfile.mkstemp(prefix='tts_', suffix='.wav')
-                os.close(fd_wav)
-                audio = AudioSegment.from_file(self._raw_mp3, format='mp3')
-                audio.export(wav_path, format='wav')
-                # set final file and remove mp3
-                self.audio_file = wav_path
-                try:
-                    os.remove(self._raw_mp3)
-                except Exception:
-                    pass
-                self._raw_mp3 = None
-                return self.audio_file
-            except Exception as e:
-                # conversion failed - fall back to mp3 playback
-                print('pydub conversion failed, will try mp3 playback:', e)
+            raise
 
-        # otherwise keep mp3
-        self.audio_file = self._raw_mp3
-        return self.audio_file
+    def export(self, dest):
+        """Save the current audio to `dest`, converting to WAV when `dest` ends with .wav."""
+        if not self.audio_file or not os.path.exists(self.audio_file):
+            raise RuntimeError("No audio file to save. Generate it first.")
+        if dest.lower().endswith('.wav') and self.audio_file.endswith('.mp3'):
+            _mp3_to_wav(self.audio_file, dest)
+        else:
+            shutil.copyfile(self.audio_file, dest)
+        return dest
 
     def play(self):
         ensure_pygame()
@@ -148,13 +415,31 @@ class TTSPlayer:
                     pygame.mixer.music.stop()
                 except Exception:
                     pass
-                pygame.mixer.music.load(self.audio_file)
+                self._load()
                 pygame.mixer.music.play()
                 self.is_playing = True
                 self.paused = False
             except Exception as e:
                 raise RuntimeError('Playback failed: ' + str(e))
 
+    def _load(self):
+        # always load the most recent generation
+        path, buf = self._active_files[-1]
+        if buf is not None:
+            # SDL_mixer streams from the buffer, so it stays referenced until released
+            buf.seek(0)
+            pygame.mixer.music.load(buf, 'mp3')
+        else:
+            pygame.mixer.music.load(path)
+
+    def release_finished(self):
+        """
+        Drop generations older than the current one, freeing their in-memory buffers.
+        Their files live in the cache, so they become eligible for eviction again.
+        """
+        with self.lock:
+            self._active_files = self._active_files[-1:]
+
     def pause(self):
         try:
             ensure_pygame()
@@ -192,7 +477,7 @@ class TTSPlayer:
                     pygame.mixer.music.stop()
                 except Exception:
                     pass
-                pygame.mixer.music.load(self.audio_file)
+                self._load()
                 pygame.mixer.music.play()
                 self.is_playing = True
                 self.paused = False
@@ -201,38 +486,30 @@ class TTSPlayer:
                 raise
 
     def _stop_and_cleanup_playback(self):
-        # Attempt to stop playback and quit mixer to release file locks
+        # Stop and unload the track to release file locks; the mixer itself stays open
         try:
             if PYGAME_AVAILABLE and pygame is not None and pygame.mixer.get_init():
                 try:
                     pygame.mixer.music.stop()
-                    pygame.mixer.quit()
+                    pygame.mixer.music.unload()
                 except Exception:
                     pass
         except Exception:
             pass
 
     def cleanup(self):
-        # remove temp files
-        paths = []
-        if self.audio_file:
-            paths.append(self.audio_file)
-        if self._raw_mp3:
-            paths.append(self._raw_mp3)
-        for p in paths:
-            try:
-                if p and os.path.exists(p):
-                    os.remove(p)
-            except Exception:
-                pass
-        self.audio_file = None
-        self._raw_mp3 = None
+        # stop playback so buffers and file locks are released; cached files are kept
+        self._stop_and_cleanup_playback()
+        with self.lock:
+            self._active_files = []
         self.is_playing = False
         self.paused = False
 
 
 # ------------------------- GUI App (original layout restored) -------------------------
 class EnglishLearningApp(ttk.Window):
+    DICT_TTL = 30 * 24 * 3600   # dictionary entries are effectively static
+
     def __init__(self):
         super().__init__(themename="superhero")
         self.title('English Multi-language Translator App')
@@ -274,7 +551,10 @@ class EnglishLearningApp(ttk.Window):
         }
 
         self.lang_var = tk.StringVar(value='English (en)')
-        self.lang_menu = ttk.OptionMenu(top_controls, self.lang_var, 'English (en)', *self.languages.keys())
+        # language code resolved once per selection, so handlers don't parse the label each time
+        self.lang_code_var = tk.StringVar(value='en')
+        self.lang_menu = ttk.OptionMenu(top_controls, self.lang_var, 'English (en)', *self.languages.keys(),
+                                        command=lambda key: self.lang_code_var.set(self.languages[key]))
         self.lang_menu.pack(side='left', padx=6)
 
         # Main notebook and tabs (original-like positions)
@@ -312,6 +592,8 @@ class EnglishLearningApp(ttk.Window):
         self.pause_btn.pack(side='left', padx=4)
         self.replay_btn = ttk.Button(pb, text='Replay', command=self.on_replay, state='disabled')
         self.replay_btn.pack(side='left', padx=4)
+        self.save_audio_btn = ttk.Button(pb, text='Save Audio', command=self.on_save_audio, state='disabled')
+        self.save_audio_btn.pack(side='left', padx=4)
 
         # Right pane: quick samples
         ttk.Label(right, text='Quick samples (click to use):').pack(anchor='w')
@@ -322,8 +604,9 @@ class EnglishLearningApp(ttk.Window):
             "Talk about a memorable trip you took.",
             "Describe a daily routine for a student preparing for exams.",
         ]
-        for s in self.sample_contexts:
-            btn = ttk.Button(right, text=(s if len(s) < 35 else s[:32] + '...'), command=lambda t=s: self.use_sample(t))
+        sample_labels = [s if len(s) < 35 else s[:32] + '...' for s in self.sample_contexts]
+        for s, label in zip(self.sample_contexts, sample_labels):
+            btn = ttk.Button(right, text=label, command=lambda t=s: self.use_sample(t))
             btn.pack(fill='x', pady=3)
 
         ttk.Separator(self).pack(fill='x')
@@ -361,6 +644,12 @@ class EnglishLearningApp(ttk.Window):
         # TTS player instance
         self.player = TTSPlayer()
 
+        # open the audio device once for the app's lifetime; it is only closed in on_close
+        try:
+            ensure_pygame()
+        except Exception as e:
+            print('Audio init failed:', e)
+
         # Status label
         self.status_lbl = ttk.Label(self, text='')
         self.status_lbl.pack(side='bottom', fill='x')
@@ -368,35 +657,89 @@ class EnglishLearningApp(ttk.Window):
         # Ensure app closes cleanly
         self.protocol('WM_DELETE_WINDOW', self.on_close)
 
+        # stripped buffer contents per text widget, dropped whenever the widget is edited
+        self._text_cache = {}
+        for widget in (self.context_text, self.notes_area):
+            widget.bind('<<Modified>>', lambda e, w=widget: self._mark_text_dirty(w))
+
+        # persistent word -> (timestamp, summary) cache; shelve is not thread-safe, hence the lock
+        self._dict_lock = threading.Lock()
+        try:
+            self._dict_db = shelve.open(os.path.join(tempfile.gettempdir(), 'eng_dict.db'))
+        except Exception as e:
+            print('Dictionary cache unavailable:', e)
+            self._dict_db = None
+
+        # UI changes queued by worker threads, applied in batches by _drain_ui
+        self._ui_queue = queue.SimpleQueue()
+        self.after(50, self._drain_ui)
+
+        # latest generate job submitted to the worker pool
+        self._current_future = None
+
+        # pending Tk checker for the end of playback (see _watch_playback)
+        self._end_poll_id = None
+
+        # Prefetch sample audio once the UI settles, and again whenever the language changes
+        self._gen_sem = threading.Semaphore(1)
+        self._prefetch_gen = 0
+        # user generations waiting for or entering _gen_sem; prefetch backs off while any are
+        self._user_pending = 0
+        self._pending_lock = threading.Lock()
+        self._no_user_pending = threading.Event()
+        self._no_user_pending.set()
+        self.after(2000, self._start_prefetch)
+        self.lang_code_var.trace_add('write', self._start_prefetch)
+
     # ----------------- Event handlers & helpers -----------------
+    def _mark_text_dirty(self, widget):
+        self._text_cache.pop(widget, None)
+        # reset the flag so the next edit fires <<Modified>> again
+        widget.edit_modified(False)
+
+    def _text_of(self, widget):
+        # only copy the buffer out of Tk when it changed since the last read
+        text = self._text_cache.get(widget)
+        if text is None:
+            text = '' if widget.index('end-1c') == '1.0' else widget.get('1.0', 'end').strip()
+            self._text_cache[widget] = text
+        return text
+
     def use_sample(self, text):
         self.context_text.delete('1.0', 'end')
         self.context_text.insert('1.0', text)
 
     def on_generate_audio(self):
-        text = self.context_text.get('1.0', 'end').strip()
+        text = self._text_of(self.context_text)
         if not text:
             text = random.choice(self.sample_contexts)
             self.context_text.insert('1.0', text)
 
         # disable playback buttons while generating
         self._set_playback_buttons_state('disabled')
-        threading.Thread(target=self._generate_and_play_thread, args=(text,), daemon=True).start()
+        # a newer click supersedes a generation that has not started yet
+        if self._current_future is not None:
+            self._current_future.cancel()
+        self._current_future = _pool.submit(self._generate_and_play_thread, text)
 
     def _generate_and_play_thread(self, text):
         try:
-            lang_key = self.lang_var.get()
-            lang_code = self.languages.get(lang_key, 'en')
-            self._set_status('Translating...')
-            # translate text using deep-translator
+            lang_code = self.lang_code_var.get()
+            # hold the semaphore so background prefetch pauses while the user waits
+            self._acquire_user_turn()
             try:
-                translated = GoogleTranslator(source='auto', target=lang_code).translate(text)
-            except Exception as e:
-                raise RuntimeError('Translation failed: ' + str(e))
+                self._set_status('Translating...')
+                # translate text using deep-translator
+                try:
+                    translated = _translate_context(lang_code, text)
+                except Exception as e:
+                    raise RuntimeError('Translation failed: ' + str(e))
 
-            self._set_status('Generating audio...')
-            # generate TTS (this will create a unique temporary file)
-            audio_path = self.player.generate(translated, lang=lang_code)
+                self._set_status('Generating audio...')
+                # generate TTS (served from the cache when available)
+                audio_path = self.player.generate(translated, lang=lang_code)
+            finally:
+                self._gen_sem.release()
 
             self._set_status('Playing...')
             # initialize pygame and play (do minimal pygame init on main thread)
@@ -404,40 +747,109 @@ class EnglishLearningApp(ttk.Window):
                 ensure_pygame()
             except Exception as e:
                 # show error on main thread and abort
-                self.after(0, lambda: messagebox.showerror('Audio Error', str(e)))
-                self.after(0, lambda: self._set_playback_buttons_state('disabled'))
+                self._post('error', 'Audio Error', str(e))
+                self._post('buttons', 'disabled')
                 return
 
-            # start playback on main thread
-            self.after(0, lambda: self._start_playback_ui())
-
-            # wait while playback busy
-            while True:
-                try:
-                    busy = pygame.mixer.music.get_busy() if (PYGAME_AVAILABLE and pygame is not None) else False
-                except Exception:
-                    busy = False
-                if not busy:
-                    break
-                time.sleep(0.2)
-
-            self._set_status('Ready')
+            # start playback on main thread; _poll_end reports when it finishes
+            self._post('play')
         except Exception as e:
             print('TTS error:', e)
             traceback.print_exc()
-            self.after(0, lambda: messagebox.showerror('TTS Error', str(e)))
-            self._set_playback_buttons_state('disabled')
+            self._post('error', 'TTS Error', str(e))
+            self._post('buttons', 'disabled')
             self._set_status('Error')
 
+    def _start_prefetch(self, *_):
+        # a newer prefetch (e.g. after a language change) makes older ones stop early
+        self._prefetch_gen += 1
+        lang_code = self.lang_code_var.get()
+        threading.Thread(target=self._prefetch_thread,
+                         args=(self._prefetch_gen, lang_code, list(self.sample_contexts)),
+                         daemon=True).start()
+
+    def _prefetch_thread(self, gen, lang_code, samples):
+        # translate every sample concurrently, then synthesize them one at a time.
+        # The translation batch runs without the semaphore so a user click never waits on it.
+        translations = list(_io_pool.map(lambda t: self._prefetch_translate(lang_code, t), samples))
+        for translated in translations:
+            if translated is None:
+                continue
+            if not self._acquire_prefetch_turn(gen):
+                return
+            try:
+                self.player.prefetch(translated, lang=lang_code)
+            except Exception as e:
+                print('Prefetch error:', e)
+            finally:
+                self._gen_sem.release()
+
+    def _acquire_user_turn(self):
+        # flag the user as pending before blocking, so prefetch stops re-taking the semaphore
+        with self._pending_lock:
+            self._user_pending += 1
+            self._no_user_pending.clear()
+        try:
+            self._gen_sem.acquire()
+        finally:
+            with self._pending_lock:
+                self._user_pending -= 1
+                if not self._user_pending:
+                    self._no_user_pending.set()
+
+    def _acquire_prefetch_turn(self, gen):
+        # yield to user-initiated generation: only take the semaphore while no user is pending.
+        # Returns False (without holding it) once a newer prefetch has superseded this one.
+        while gen == self._prefetch_gen:
+            # timeouts only bound how long a superseded prefetch takes to notice
+            if not self._no_user_pending.wait(timeout=0.5):
+                continue
+            if not self._gen_sem.acquire(timeout=0.5):
+                continue
+            if self._no_user_pending.is_set() and gen == self._prefetch_gen:
+                return True
+            # a user click arrived while we were acquiring: hand the semaphore over
+            self._gen_sem.release()
+        return False
+
+    def _prefetch_translate(self, lang_code, text):
+        try:
+            return _translate_context(lang_code, text)
+        except Exception as e:
+            print('Prefetch error:', e)
+            return None
+
     def _start_playback_ui(self):
         try:
             self.player.play()
+            self._watch_playback()
             self._enable_playback_buttons()
             self._set_status('Playing')
         except Exception as e:
             messagebox.showerror('Playback Error', str(e))
             self._set_playback_buttons_state('disabled')
 
+    def _watch_playback(self):
+        # (re)arm a Tk-side get_busy() poll instead of a worker thread sleeping for the whole
+        # clip; pygame's end event needs its display/event system, which this Tk app never starts
+        if self._end_poll_id is not None:
+            self.after_cancel(self._end_poll_id)
+        self._end_poll_id = self.after(250, self._poll_end)
+
+    def _poll_end(self):
+        self._end_poll_id = None
+        try:
+            # get_busy() is also False while paused, which is not the end of the clip
+            ended = not pygame.mixer.music.get_busy() and not self.player.paused
+        except Exception:
+            ended = True
+        if ended:
+            self.player.is_playing = False
+            self.player.release_finished()
+            self._set_status('Ready')
+        else:
+            self._end_poll_id = self.after(250, self._poll_end)
+
     def on_play(self):
         try:
             ensure_pygame()
@@ -446,6 +858,7 @@ class EnglishLearningApp(ttk.Window):
                 self._set_status('Playing')
             elif not (pygame.mixer.music.get_busy()):
                 self.player.play()
+                self._watch_playback()
                 self._set_status('Playing')
         except Exception as e:
             messagebox.showerror('Play Error', str(e))
@@ -467,21 +880,82 @@ class EnglishLearningApp(ttk.Window):
     def on_replay(self):
         try:
             self.player.replay()
+            self._watch_playback()
             self._enable_playback_buttons()
             self.pause_btn.config(text='Pause')
             self._set_status('Playing')
         except Exception as e:
             messagebox.showerror('Replay Error', str(e))
 
+    def on_save_audio(self):
+        file_path = filedialog.asksaveasfilename(
+            title="Save Audio As",
+            defaultextension=".mp3",
+            filetypes=[("MP3 Audio", ".mp3"), ("WAV Audio (needs ffmpeg)", ".wav")]
+        )
+        if not file_path:
+            return
+        try:
+            self.player.export(file_path)
+            messagebox.showinfo('Saved', f'Audio successfully saved to:\n{file_path}')
+        except Exception as e:
+            messagebox.showerror('Save Error', str(e))
+
     def _set_status(self, text):
-        self.after(0, lambda: self.status_lbl.config(text=text))
+        self._post('status', text)
+
+    def _post(self, kind, *args):
+        # safe from any thread; applied on the Tk thread by _drain_ui
+        self._ui_queue.put((kind, args))
+
+    def _drain_ui(self):
+        # apply every queued UI change in one pass; only the latest status is shown
+        status = None
+        while True:
+            try:
+                kind, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                if kind == 'status':
+                    status = args[0]
+                elif kind == 'buttons':
+                    self._set_playback_buttons_state(args[0])
+                elif kind == 'play':
+                    self._start_playback_ui()
+                elif kind == 'error':
+                    messagebox.showerror(*args)
+                elif kind == 'meaning':
+                    text, replace = args
+                    if replace:
+                        self.meaning_box.delete('1.0', 'end')
+                        self.meaning_box.insert('1.0', text)
+                    else:
+                        self.meaning_box.insert('end', text)
+                elif kind == 'notes':
+                    original, translated = args
+                    # never overwrite notes the user edited while the translation was running
+                    if self._text_of(self.notes_area) == original:
+                        self.notes_area.delete('1.0', 'end')
+                        self.notes_area.insert('1.0', translated)
+                        status = 'Ready'
+                    else:
+                        status = 'Notes changed during translation; not replaced'
+                        messagebox.showinfo('Notes Changed',
+                                            'Your notes were edited while translating, so the '
+                                            'translation was not applied. Click Translate Notes again.')
+            except Exception as e:
+                print('UI update error:', e)
+        if status is not None:
+            self.status_lbl.config(text=status)
+        self.after(50, self._drain_ui)
 
     def _enable_playback_buttons(self):
         self._set_playback_buttons_state('normal')
         self.pause_btn.config(text='Pause')
 
     def _set_playback_buttons_state(self, state):
-        for b in (self.play_btn, self.pause_btn, self.replay_btn):
+        for b in (self.play_btn, self.pause_btn, self.replay_btn, self.save_audio_btn):
             try:
                 b.config(state=state)
             except Exception:
@@ -493,68 +967,65 @@ class EnglishLearningApp(ttk.Window):
         if not word:
             messagebox.showinfo('Input required', 'Please type a word to search for meaning.')
             return
-        threading.Thread(target=self._fetch_meaning_thread, args=(word,), daemon=True).start()
+        _pool.submit(self._fetch_meaning_thread, word)
 
     def _fetch_meaning_thread(self, word):
         try:
-            self.meaning_box.delete('1.0', 'end')
-            self.meaning_box.insert('1.0', f'Searching meaning for "{word}"...\n')
-            url = f'https://api.dictionaryapi.dev/api/v2/entries/en/{word}'
-            resp = requests.get(url, timeout=8)
-            if resp.status_code != 200:
-                self.meaning_box.insert('end', f'No definition found for "{word}".\n')
+            self._post('meaning', f'Searching meaning for "{word}"...\n', True)
+            short_text = self._dict_get(word)
+            if short_text is None:
+                short_text = _lookup_word(word)
+                if short_text is not None:
+                    self._dict_put(word, short_text)
+            if short_text is None:
+                self._post('meaning', f'No definition found for "{word}".\n', False)
                 return
-            data = resp.json()
-            short_text = ''
-            if isinstance(data, list) and len(data) > 0:
-                entry = data[0]
-                word_title = entry.get('word', word)
-                short_text += f'Word: {word_title}\n'
-                phonetics = entry.get('phonetics', [])
-                if phonetics:
-                    p = phonetics[0].get('text')
-                    if p:
-                        short_text += f'Pronunciation: {p}\n'
-                meanings = entry.get('meanings', [])
-                if meanings:
-                    first_meaning = meanings[0]
-                    part = first_meaning.get('partOfSpeech', '')
-                    defs = first_meaning.get('definitions', [])
-                    if defs:
-                        d0 = defs[0]
-                        definition = d0.get('definition', '')
-                        example = d0.get('example')
-                        short_text += f'Part of speech: {part}\n'
-                        short_text += f'Definition: {definition}\n'
-                        if example:
-                            short_text += f'Example: {example}\n'
-                else:
-                    short_text += 'No meanings found.\n'
-            else:
-                short_text = f'No definition found for "{word}".\n'
 
             # Translate short_text if requested using global language
-            target_key = self.lang_var.get()
-            target_code = self.languages.get(target_key, 'en')
+            target_code = self.lang_code_var.get()
             if target_code != 'en':
                 try:
-                    translated = GoogleTranslator(source='auto', target=target_code).translate(short_text)
-                    full_text = '--- Original (English) ---\n' + short_text + '\n\n--- Translated ---\n' + translated
+                    translated = _translate_cached('auto', target_code, short_text)
+                    full_text = ''.join(['--- Original (English) ---\n', short_text,
+                                         '\n\n--- Translated ---\n', translated])
                 except Exception as e:
-                    full_text = short_text + f'\n\n(Translation failed: {e})'
+                    full_text = f'{short_text}\n\n(Translation failed: {e})'
             else:
                 full_text = short_text
 
-            self.meaning_box.delete('1.0', 'end')
-            self.meaning_box.insert('1.0', full_text)
+            self._post('meaning', full_text, True)
         except Exception as e:
             print('Meaning lookup error:', e)
             traceback.print_exc()
-            self.meaning_box.insert('end', f'Error: {e}')
+            self._post('meaning', f'Error: {e}', False)
+
+    def _dict_get(self, word):
+        # on-disk dictionary cache; entries older than DICT_TTL are refetched
+        if self._dict_db is None:
+            return None
+        try:
+            with self._dict_lock:
+                stored = self._dict_db.get(word.lower())
+        except Exception as e:
+            print('Dictionary cache read failed:', e)
+            return None
+        if stored is None:
+            return None
+        ts, text = stored
+        return text if time.time() - ts < self.DICT_TTL else None
+
+    def _dict_put(self, word, text):
+        if self._dict_db is None:
+            return
+        try:
+            with self._dict_lock:
+                self._dict_db[word.lower()] = (time.time(), text)
+        except Exception as e:
+            print('Dictionary cache write failed:', e)
 
     # ----------------- Notes -----------------
     def save_notes(self):
-        text = self.notes_area.get('1.0', 'end').strip()
+        text = self._text_of(self.notes_area)
         if not text:
             messagebox.showinfo('No Notes', 'There is nothing to save.')
             return
@@ -590,21 +1061,33 @@ class EnglishLearningApp(ttk.Window):
             messagebox.showerror('Load Error', str(e))
 
     def translate_notes(self):
-        text = self.notes_area.get('1.0', 'end').strip()
+        text = self._text_of(self.notes_area)
         if not text:
             messagebox.showinfo('No Notes', 'There is nothing to translate.')
             return
-        target_key = self.lang_var.get()
-        target_code = self.languages.get(target_key, 'en')
+        target_code = self.lang_code_var.get()
+        self._set_status('Translating notes...')
+        _pool.submit(self._translate_notes_thread, text, target_code)
+
+    def _translate_notes_thread(self, text, target_code):
         try:
-            translated = GoogleTranslator(source='auto', target=target_code).translate(text)
-            self.notes_area.delete('1.0', 'end')
-            self.notes_area.insert('1.0', translated)
+            translated = _translate_paragraphs('auto', target_code, text)
+            self._post('notes', text, translated)
         except Exception as e:
-            messagebox.showerror('Translation Error', str(e))
+            self._post('error', 'Translation Error', str(e))
+            self._set_status('Error')
 
     # ----------------- Cleanup -----------------
     def on_close(self):
+        _pool.shutdown()
+        _io_pool.shutdown()
+        try:
+            if self._dict_db is not None:
+                with self._dict_lock:
+                    self._dict_db.close()
+                    self._dict_db = None
+        except Exception:
+            pass
         try:
             self.player.cleanup()
             if PYGAME_AVAILABLE and pygame is not None:
@@ -624,8 +1107,8 @@ if __name__ == '__main__':
         missing.append('gTTS (pip install gTTS)')
     if not PYGAME_AVAILABLE or pygame is None:
         missing.append('pygame (pip install pygame)')
-    if AudioSegment is None:
-        missing.append('pydub (pip install pydub) + ffmpeg (recommended for WAV conversion)')
+    if FFMPEG_PATH is None:
+        missing.append('ffmpeg (only needed to save audio as WAV)')
     if missing:
         print("Some recommended libraries may be missing:\n" + "\n".join(missing) +
               "\nThe app will still try to run, but TTS/playback may be limited. "